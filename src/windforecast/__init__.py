@@ -1,5 +1,8 @@
 """Wind forecast analyzer and report generator for kitesurfing conditions."""
 
+import importlib
+from typing import Any
+
 # Initialize version to fallback
 __version__ = "0.0.0"
 
@@ -22,12 +25,17 @@ except ImportError:
         # Keep fallback version
         pass
 
-from . import render  # Expose the render module directly
-from .cli import main
-from .config import load_config
-from .forecast import get_wind_forecast
-from .render import HAS_PILLOW, ReportRenderer
-from .schemas import WindSpeedThresholds
+# Public attributes are resolved lazily (PEP 562) so that `import windforecast`
+# doesn't drag in pandas, requests, Pillow etc. until they are actually used.
+_LAZY_ATTRS = {
+    "render": (".render", None),
+    "ReportRenderer": (".render", "ReportRenderer"),
+    "HAS_PILLOW": (".render", "HAS_PILLOW"),
+    "main": (".cli", "main"),
+    "load_config": (".config", "load_config"),
+    "get_wind_forecast": (".forecast", "get_wind_forecast"),
+    "WindSpeedThresholds": (".schemas", "WindSpeedThresholds"),
+}
 
 __all__ = [
     "render",
@@ -39,3 +47,18 @@ __all__ = [
     "WindSpeedThresholds",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value  # Cache so __getattr__ only fires once per name
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(__all__) | set(globals()))
@@ -0,0 +1,44 @@
+"""Internal JSON helpers with optional orjson acceleration.
+
+orjson parses and serializes several times faster than the stdlib json
+module. It is kept optional: when it is not installed, these helpers fall
+back to the stdlib so the package works with its base dependencies only.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def dumps_canonical(obj: Any) -> bytes:
+    """Serialize to compact, key-sorted UTF-8 JSON bytes.
+
+    The output is byte-stable for equal inputs, making it suitable as
+    hashing material for content-addressed caches.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize to pretty-printed (2-space indented) UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
@@ -12,12 +12,12 @@ This header ensures AI tools like GitHub Copilot maintain project consistency.
 """
 
 import argparse
-import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from . import __version__
+from . import __version__, _json
 from .config import load_config
 from .forecast import ForecastClient
 from .logging import configure_logging
@@ -64,35 +64,44 @@ def main() -> int:
         client = ForecastClient(config)
         data = client.fetch_forecasts()
 
-        # Save intermediate JSON
-        json_path = out_dir / "windows.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        logger.info(f"Wrote {json_path}")
-
-        # Generate reports
+        # Generate reports; the intermediate JSON dump only reads `data`,
+        # so it overlaps with HTML rendering in a worker thread
         logger.info("Generating reports...")
         renderer = ReportRenderer()
 
+        json_path = out_dir / "windows.json"
         html_path = out_dir / "report.html"
-        renderer.render_html(data, html_path)
-        logger.info(f"Wrote {html_path}")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            json_future = executor.submit(
+                lambda: json_path.write_bytes(_json.dumps_indented(data))
+            )
+            renderer.render_html(data, html_path)
+            logger.info(f"Wrote {html_path}")
+            json_future.result()
+            logger.info(f"Wrote {json_path}")
 
         if args.jpg or args.pdf:
-            if args.jpg:
-                jpg_path = out_dir / "report.jpg"
-                if renderer.generate_jpg(html_path, jpg_path):
-                    logger.info(f"Wrote {jpg_path}")
-                else:
-                    logger.error("Failed to generate JPG")
-                    return 1
-
-            if args.pdf:
-                pdf_path = out_dir / "report.pdf"
-                if renderer.generate_pdf(html_path, pdf_path):
-                    logger.info(f"Wrote {pdf_path}")
-                else:
-                    logger.error("Failed to generate PDF")
+            # JPG and PDF each drive their own Chrome process over the same
+            # HTML, so when both are requested they run concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                outputs = []
+                if args.jpg:
+                    jpg_path = out_dir / "report.jpg"
+                    jpg_future = executor.submit(renderer.generate_jpg, html_path, jpg_path)
+                    outputs.append(("JPG", jpg_path, jpg_future))
+                if args.pdf:
+                    pdf_path = out_dir / "report.pdf"
+                    pdf_future = executor.submit(renderer.generate_pdf, html_path, pdf_path)
+                    outputs.append(("PDF", pdf_path, pdf_future))
+
+                failed = False
+                for name, path, future in outputs:
+                    if future.result():
+                        logger.info(f"Wrote {path}")
+                    else:
+                        logger.error(f"Failed to generate {name}")
+                        failed = True
+                if failed:
                     return 1
 
         return 0
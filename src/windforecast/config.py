@@ -1,37 +1,90 @@
 """Configuration management for the wind forecast application."""
 
+import functools
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Optional, Union
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from .schemas import WindConfig
+from . import _json
+from .schemas import Conditions, DirectionSector, ForecastConfig, TimeWindow, WindConfig, WindSpot
 
 logger = logging.getLogger(__name__)
 
+# Built once at import so Pydantic materializes the core schema a single
+# time; validate_python on the adapter skips per-call schema lookups.
+_WIND_VALIDATOR = TypeAdapter(WindConfig)
+
+# Model-validator messages that surface as bare ValueErrors with a stable
+# message. Matched by substring since Pydantic prefixes "Value error, ".
+_KNOWN_VALUE_ERRORS = (
+    "Band thresholds must be in strictly descending order",
+    "day_end must be after day_start",
+)
+
+
+def _construct_config(data: dict) -> WindConfig:
+    """Build a WindConfig from already-validated data, skipping validators.
+
+    Only safe for trusted input (e.g. re-loading a config this process
+    validated and persisted earlier); nested models are constructed
+    recursively since model_construct does not coerce them.
+    """
+    return WindConfig.model_construct(
+        spots=[
+            WindSpot.model_construct(
+                name=s["name"],
+                lat=s["lat"],
+                lon=s["lon"],
+                dir_sector=DirectionSector.model_construct(**s["dir_sector"]),
+            )
+            for s in data["spots"]
+        ],
+        forecast=ForecastConfig.model_construct(**data["forecast"]),
+        time_window=TimeWindow.model_construct(**data["time_window"]),
+        conditions=Conditions.model_construct(
+            bands=[tuple(band) for band in data["conditions"]["bands"]],
+            rain_limit=data["conditions"]["rain_limit"],
+        ),
+    )
+
+
+# Standard config locations, built once. The relative entry is resolved
+# against the current directory at lookup time.
+_SEARCH_PATHS = (
+    Path("config.json"),
+    Path(__file__).resolve().parent.parent / "config.json",
+)
+
 
 def find_config_file() -> Optional[Path]:
     """
     Search for config.json in standard locations.
 
     Returns:
-        Path to config.json if found, None otherwise.
+        Absolute path to config.json if found, None otherwise. The path is
+        made absolute so it stays valid if the process later changes
+        directory.
     """
-    search_paths = [Path.cwd() / "config.json", Path(__file__).parent.parent / "config.json"]
-    for path in search_paths:
-        if path.exists():
-            return path
+    for path in _SEARCH_PATHS:
+        if os.path.isfile(path):
+            return Path(os.path.abspath(path))
     return None
 
 
-def load_config(config_path: Optional[Union[Path, str]] = None) -> WindConfig:
+def load_config(
+    config_path: Optional[Union[Path, str]] = None, trusted: bool = False
+) -> WindConfig:
     """
     Load and validate configuration from a JSON file.
 
     Args:
         config_path: Path to config.json. If None, looks in standard locations.
+        trusted: Skip validation and construct models directly. Only for
+            configs this process already validated (e.g. reloads).
 
     Returns:
         WindConfig object with validated configuration.
@@ -51,10 +104,29 @@ def load_config(config_path: Optional[Union[Path, str]] = None) -> WindConfig:
     logger.debug(f"Loading config from {config_path}")
 
     try:
-        with open(config_path, encoding="utf-8") as f:
+        # Key the cache on the absolute path and the file's mtime so edits
+        # (and chdir between loads) invalidate it; the stat is far cheaper
+        # than re-parsing and re-validating.
+        config_path = os.path.abspath(config_path)
+        mtime_ns = os.stat(config_path).st_mtime_ns
+        return _load_config_cached(config_path, mtime_ns, trusted)
+    except FileNotFoundError as e:
+        logger.error(f"Config file not found: {e}")
+        raise  # Re-raise FileNotFoundError directly
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime_ns: int, trusted: bool) -> WindConfig:
+    """Parse and validate a config file; cached on (path, mtime, trusted)."""
+    try:
+        with open(config_path, "rb") as f:
             try:
-                data = json.load(f)
-                logger.debug(f"Loaded configuration data: {json.dumps(data, indent=2)}")
+                data = _json.loads(f.read())
+                # Guard: the pretty dump is pure waste unless DEBUG is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Loaded configuration data: %s", _json.dumps_indented(data).decode()
+                    )
             except json.JSONDecodeError as e:
                 msg = f"Invalid JSON in config file: {e}"
                 logger.error(msg)
@@ -62,11 +134,12 @@ def load_config(config_path: Optional[Union[Path, str]] = None) -> WindConfig:
 
         # Validate and create config object
         try:
-            config = WindConfig.model_validate(data)
+            config = _construct_config(data) if trusted else _WIND_VALIDATOR.validate_python(data)
             # Log validation success
             logger.info(f"Loaded configuration with {len(config.spots)} spots")
-            for spot in config.spots:
-                logger.debug(f"  - {spot.name} ({spot.lat}, {spot.lon})")
+            if logger.isEnabledFor(logging.DEBUG):
+                for spot in config.spots:
+                    logger.debug(f"  - {spot.name} ({spot.lat}, {spot.lon})")
             return config
         except ValidationError as e:
             # Extract error details
@@ -75,20 +148,11 @@ def load_config(config_path: Optional[Union[Path, str]] = None) -> WindConfig:
 
             # Find first relevant validation error
             for error in errors:
-                error_type = error.get("type", "")
                 error_msg = error.get("msg", "")
-
-                # Check for band threshold validation error
-                if "Band thresholds must be in strictly descending order" in error_msg:
-                    msg = "Band thresholds must be in strictly descending order"
-                    logger.error(f"Invalid configuration: {msg}")
-                    raise ValueError(msg)
-
-                # Check for day start/end validation error
-                if "day_end must be after day_start" in error_msg:
-                    msg = "day_end must be after day_start"
-                    logger.error(f"Invalid configuration: {msg}")
-                    raise ValueError(msg)
+                for marker in _KNOWN_VALUE_ERRORS:
+                    if marker in error_msg:
+                        logger.error(f"Invalid configuration: {marker}")
+                        raise ValueError(marker)
 
             # If no specific validation error found, raise first error
             msg = errors[0]["msg"]
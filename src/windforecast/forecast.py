@@ -1,7 +1,9 @@
 """Forecast data fetching and processing."""
 
+import functools
 import logging
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from .config import load_config
@@ -25,21 +27,54 @@ def get_wind_forecast(config_path: Optional[str] = None) -> Dict[str, Any]:
     return client.fetch_forecasts()
 
 
-import pandas as pd
-import requests
+import numpy as np
 
+from . import _json
 from .schemas import WindConfig, WindSpot
 
 logger = logging.getLogger(__name__)
 
 
+def _use_fast_json(response: "requests.Response", *args: Any, **kwargs: Any) -> "requests.Response":
+    """Response hook: route Response.json() through the orjson-backed helper.
+
+    _get_json parses content directly, but this keeps any future fetch that
+    calls .json() on the shared session from regressing to stdlib json.
+    """
+    response.json = lambda **kw: _json.loads(response.content)  # type: ignore[method-assign]
+    return response
+
+
+@functools.lru_cache(maxsize=16)
+def _band_tables(bands: Tuple[Tuple[str, float], ...]) -> Tuple[List[str], "np.ndarray"]:
+    """Compile config bands into classification tables, cached per config.
+
+    Thresholds are validated strictly descending, so negating them gives
+    an ascending array for searchsorted.
+    """
+    labels = [label for label, _ in bands] + ["below"]
+    neg_thresholds = np.array([-thr for _, thr in bands], dtype=np.float64)
+    return labels, neg_thresholds
+
+
 class ForecastClient:
     """Client for fetching and processing wind forecast data."""
 
     def __init__(self, config: WindConfig):
+        # Deferred: requests pulls in urllib3 and friends, which callers
+        # that never instantiate a client shouldn't pay for
+        import requests
+
         self.config = config
         self.base_url = "https://api.open-meteo.com/v1/meteofrance"
         self.marine_url = "https://marine-api.open-meteo.com/v1/marine"
+        # Shared keep-alive session so the TCP/TLS handshake is paid once
+        # per host rather than once per request
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.hooks["response"].append(_use_fast_json)
 
     def fetch_forecasts(self) -> Dict[str, Any]:
         """
@@ -50,15 +85,32 @@ class ForecastClient:
         """
         logger.info("Fetching forecast data...")
         spots = self.config.spots
-        hourly, min15, waves = self._fetch_weather(spots)
-        model_updates = self._fetch_model_updates()
+        # All five HTTP calls are independent; issuing them on one pool
+        # collapses wall time to roughly the slowest round-trip
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            hourly_f, min15_f, wave_f = self._submit_weather(spots, executor)
+            update_futures = self._submit_model_updates(executor)
+            hourly = hourly_f.result()
+            min15 = min15_f.result()
+            waves = wave_f.result()
+            model_updates = self._collect_model_updates(update_futures)
 
         return self._process_forecasts(hourly, min15, waves, model_updates)
 
-    def _fetch_weather(
-        self, spots: List[WindSpot]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
-        """Fetch weather data from API endpoints."""
+    def _get_json(
+        self, url: str, params: Optional[Dict[str, Any]] = None, timeout: int = 30
+    ) -> Any:
+        """GET a URL on the shared session and parse the JSON body."""
+        r = self._session.get(url, params=params, timeout=timeout)
+        r.raise_for_status()
+        # Parse the raw bytes directly: skips requests' charset detection
+        # and str decode, and uses orjson when available
+        return _json.loads(r.content)
+
+    def _submit_weather(
+        self, spots: List[WindSpot], executor: ThreadPoolExecutor
+    ) -> Tuple[Future, Future, Future]:
+        """Submit the three weather requests to the executor."""
         lats = ",".join(str(s.lat) for s in spots)
         lons = ",".join(str(s.lon) for s in spots)
 
@@ -72,8 +124,6 @@ class ForecastClient:
             "timezone": "Europe/Madrid",
             "forecast_hours": self.config.forecast.forecast_hours_hourly,
         }
-        r_hourly = requests.get(self.base_url, params=params_hourly, timeout=30)
-        r_hourly.raise_for_status()
 
         # 15-minute forecast
         params_min15 = {
@@ -85,8 +135,6 @@ class ForecastClient:
             "timezone": "Europe/Madrid",
             "forecast_minutely_15": self.config.forecast.forecast_min15,
         }
-        r_min15 = requests.get(self.base_url, params=params_min15, timeout=30)
-        r_min15.raise_for_status()
 
         # Marine (waves)
         params_wave = {
@@ -97,25 +145,34 @@ class ForecastClient:
             "forecast_hours": self.config.forecast.forecast_hours_hourly,
             "cell_selection": "sea",
         }
-        r_wave = requests.get(self.marine_url, params=params_wave, timeout=30)
-        r_wave.raise_for_status()
 
-        return r_hourly.json(), r_min15.json(), r_wave.json()
+        return (
+            executor.submit(self._get_json, self.base_url, params_hourly),
+            executor.submit(self._get_json, self.base_url, params_min15),
+            executor.submit(self._get_json, self.marine_url, params_wave),
+        )
+
+    _UPDATE_MODELS = {
+        "meteofrance_arome_france_hd": "AROME France HD (hourly)",
+        "meteofrance_arome_france_hd_15min": "AROME France HD (15-min)",
+    }
 
-    def _fetch_model_updates(self) -> Dict[str, Any]:
-        """Fetch model update metadata."""
+    def _submit_model_updates(self, executor: ThreadPoolExecutor) -> Dict[str, Future]:
+        """Submit the model update metadata requests to the executor."""
         base = "https://openmeteo.s3.amazonaws.com/data_spatial"
-        models = {
-            "meteofrance_arome_france_hd": "AROME France HD (hourly)",
-            "meteofrance_arome_france_hd_15min": "AROME France HD (15-min)",
+        return {
+            m: executor.submit(self._get_json, f"{base}/{m}/latest.json", None, 20)
+            for m in self._UPDATE_MODELS
         }
+
+    def _collect_model_updates(self, futures: Dict[str, Future]) -> Dict[str, Any]:
+        """Gather model update metadata, keeping per-model error handling."""
+        base = "https://openmeteo.s3.amazonaws.com/data_spatial"
         out = {}
-        for m, title in models.items():
+        for m, title in self._UPDATE_MODELS.items():
             url = f"{base}/{m}/latest.json"
             try:
-                r = requests.get(url, timeout=20)
-                r.raise_for_status()
-                j = r.json()
+                j = futures[m].result()
                 run_iso = j.get("reference_time")
                 last_modified_time = j.get("last_modified_time")
                 out[m] = {
@@ -136,108 +193,109 @@ class ForecastClient:
         model_updates: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Process raw forecast data into final format."""
+        band_labels, neg_thresholds = _band_tables(tuple(self.config.conditions.bands))
+
+        def _parse_times(times: List[str]) -> np.ndarray:
+            """Parse ISO timestamps (optionally Z-suffixed) into datetime64[s]."""
+            return np.array([t.rstrip("Z") for t in times], dtype="datetime64[s]")
 
-        def _classify_band(kn: float) -> str:
-            """Classify wind speed into bands."""
-            for label, thr in self.config.conditions.bands:
-                if kn >= thr:
-                    return label
-            return "below"
+        def _float_col(values: List[Any]) -> np.ndarray:
+            """Convert an API column to float64, mapping nulls to NaN."""
+            return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
 
-        def _direction_in_sector(deg: float, sector: Optional[Dict[str, Any]]) -> bool:
-            """Check if wind direction is within sector."""
+        def _sector_mask(dir_deg: np.ndarray, sector: Optional[Dict[str, Any]]) -> np.ndarray:
+            """Vectorized check that wind directions fall within the sector."""
             if sector is None:
-                return True
-            start = float(str(sector.get("start", 0)))
-            end = float(str(sector.get("end", 360)))
-            wrap = sector.get("wrap", False)
-            if not wrap:
-                return start <= deg <= end
-            # wrapped: e.g., 225..360 and 0..45
-            return (deg >= start) or (deg <= end)
-
-        def _build_df(
-            spot_name: str,
+                return np.ones(dir_deg.shape, dtype=bool)
+            start = float(sector.get("start", 0))
+            end = float(sector.get("end", 360))
+            if sector.get("wrap", False):
+                # wrapped: e.g., 225..360 and 0..45
+                return (dir_deg >= start) | (dir_deg <= end)
+            return (dir_deg >= start) & (dir_deg <= end)
+
+        def _build_rows(
             spot_meta: Dict[str, Any],
             h: Dict[str, Any],
             m15: Dict[str, Any],
             wav: Dict[str, Any],
-        ) -> pd.DataFrame:
-            """Build DataFrame for a spot."""
+        ) -> List[Dict[str, Any]]:
+            """Build the output rows for a spot from raw API columns."""
             # Hourly data
-            ht = h["hourly"]["time"]
-            dfh = pd.DataFrame(
-                {
-                    "time": pd.to_datetime(ht),
-                    "wind_kn": h["hourly"]["wind_speed_10m"],
-                    "gust_kn": h["hourly"]["wind_gusts_10m"],
-                    "dir_deg": h["hourly"]["wind_direction_10m"],
-                    "precip": h["hourly"]["precipitation"],
-                    "freq": "H",
-                }
-            )
-
-            # 15-min data
-            mt = m15.get("minutely_15", {}).get("time", [])
-            if mt:
-                dfm = pd.DataFrame(
-                    {
-                        "time": pd.to_datetime(mt),
-                        "wind_kn": m15["minutely_15"]["wind_speed_10m"],
-                        "gust_kn": m15["minutely_15"]["wind_gusts_10m"],
-                        "dir_deg": m15["minutely_15"]["wind_direction_10m"],
-                        "precip": m15["minutely_15"]["precipitation"],
-                        "freq": "15min",
-                    }
+            hourly_vars = h["hourly"]
+            times = _parse_times(hourly_vars["time"])
+            wind = _float_col(hourly_vars["wind_speed_10m"])
+            gust = _float_col(hourly_vars["wind_gusts_10m"])
+            dir_deg = _float_col(hourly_vars["wind_direction_10m"])
+            precip = _float_col(hourly_vars["precipitation"])
+
+            # Prefer 15-min data where available, hourly beyond its horizon
+            min15_vars = m15.get("minutely_15", {})
+            if min15_vars.get("time"):
+                mtimes = _parse_times(min15_vars["time"])
+                keep = times > mtimes.max()
+                times = np.concatenate([mtimes, times[keep]])
+                wind = np.concatenate([_float_col(min15_vars["wind_speed_10m"]), wind[keep]])
+                gust = np.concatenate([_float_col(min15_vars["wind_gusts_10m"]), gust[keep]])
+                dir_deg = np.concatenate(
+                    [_float_col(min15_vars["wind_direction_10m"]), dir_deg[keep]]
                 )
-            else:
-                dfm = pd.DataFrame(columns=dfh.columns)
-
-            # Wave data
-            wt = wav["hourly"]["time"]
-            dfw = pd.DataFrame({"time": pd.to_datetime(wt), "wave_m": wav["hourly"]["wave_height"]})
-
-            # Prefer 15-min where available
-            df = pd.concat(
-                [dfm, dfh[dfh["time"] > dfm["time"].max()] if not dfm.empty else dfh],
-                ignore_index=True,
+                precip = np.concatenate([_float_col(min15_vars["precipitation"]), precip[keep]])
+
+            # Left-join wave heights on exact timestamps
+            wave_times = _parse_times(wav["hourly"]["time"])
+            wave_heights = _float_col(wav["hourly"]["wave_height"])
+            wave = np.full(times.shape, np.nan)
+            if wave_times.size:
+                # searchsorted needs a sorted haystack; the API returns
+                # chronological data but don't rely on it
+                wave_order = np.argsort(wave_times, kind="stable")
+                wave_times = wave_times[wave_order]
+                wave_heights = wave_heights[wave_order]
+                pos = np.searchsorted(wave_times, times).clip(max=wave_times.size - 1)
+                matched = wave_times[pos] == times
+                wave[matched] = wave_heights[pos[matched]]
+
+            # Daytime filter plus NaN drop across every column, in one mask
+            local_hour = times.astype("datetime64[h]").astype(np.int64) % 24
+            mask = (
+                (local_hour >= self.config.time_window.day_start)
+                & (local_hour <= self.config.time_window.day_end)
+                & ~np.isnan(wind)
+                & ~np.isnan(gust)
+                & ~np.isnan(dir_deg)
+                & ~np.isnan(precip)
+                & ~np.isnan(wave)
+            )
+            order = np.argsort(times[mask], kind="stable")
+            times, wind, gust, dir_deg, precip, wave = (
+                col[mask][order] for col in (times, wind, gust, dir_deg, precip, wave)
             )
 
-            # Merge waves
-            df = df.merge(dfw, on="time", how="left")
-
-            # Daytime filter
-            df["local_hour"] = df["time"].dt.hour
-            df = df[
-                (df["local_hour"] >= self.config.time_window.day_start)
-                & (df["local_hour"] <= self.config.time_window.day_end)
-            ].copy()
+            # Analyze conditions, one vectorized pass per column
+            dir_ok = _sector_mask(dir_deg, spot_meta.get("dir_sector"))
+            rain_ok = precip <= self.config.conditions.rain_limit
+            speed_ok = wind >= 12.0
+            kiteable = dir_ok & rain_ok & speed_ok
+            band_idx = np.searchsorted(neg_thresholds, -wind, side="left")
+            dirs = self._deg_to_16pt_vec(dir_deg)
 
-            # Analyze conditions
-            df.dropna(inplace=True)
-            df["dir_ok"] = df["dir_deg"].apply(
-                lambda d: _direction_in_sector(d, spot_meta.get("dir_sector"))
-            )
-            df["rain_ok"] = df["precip"] <= self.config.conditions.rain_limit
-            df["speed_ok"] = df["wind_kn"] >= 12.0
-            df["valid"] = df["dir_ok"] & df["rain_ok"] & df["speed_ok"]
-            df["band"] = df["wind_kn"].apply(_classify_band)
-            df["kiteable"] = df["valid"]
-            df["spot"] = spot_name
-
-            return df[
-                [
-                    "spot",
-                    "time",
-                    "wind_kn",
-                    "gust_kn",
-                    "dir_deg",
-                    "precip",
-                    "wave_m",
-                    "band",
-                    "kiteable",
-                ]
-            ].sort_values("time")
+            return [
+                {
+                    "time": t.item().isoformat(),
+                    "wind_kn": float(w),
+                    "gust_kn": float(g),
+                    "dir_deg": float(d),
+                    "dir": ds,
+                    "precip_mm_h": float(p),
+                    "wave_m": None if np.isnan(wv) else float(wv),
+                    "band": band_labels[bi],
+                    "kiteable": bool(k),
+                }
+                for t, w, g, d, ds, p, wv, bi, k in zip(
+                    times, wind, gust, dir_deg, dirs, precip, wave, band_idx, kiteable
+                )
+            ]
 
         # Process all spots
         Lh = [hourly] if isinstance(hourly, dict) else hourly
@@ -246,35 +304,18 @@ class ForecastClient:
 
         result = []
         for i, spot in enumerate(self.config.spots):
-            df = _build_df(spot.name, spot.model_dump(), Lh[i], Lm15[i], Lw[i])
-            rows = []
-            for _, r in df.iterrows():
-                rows.append(
-                    {
-                        "time": r["time"].isoformat(),
-                        "wind_kn": float(r["wind_kn"]),
-                        "gust_kn": float(r["gust_kn"]),
-                        "dir_deg": float(r["dir_deg"]),
-                        "dir": self._deg_to_16pt(r["dir_deg"]),
-                        "precip_mm_h": float(r["precip"]),
-                        "wave_m": None if pd.isna(r["wave_m"]) else float(r["wave_m"]),
-                        "band": r["band"],
-                        "kiteable": bool(r["kiteable"]),
-                    }
-                )
+            rows = _build_rows(spot.model_dump(), Lh[i], Lm15[i], Lw[i])
             result.append({"spot": spot.name, "rows": rows})
 
         return {
-            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
             "model_updates": model_updates,
             "spots": result,
             "config": self.config.model_dump(),
         }
 
-    @staticmethod
-    def _deg_to_16pt(d: float) -> str:
-        """Convert degrees to 16-point compass direction."""
-        labels = [
+    _COMPASS = np.array(
+        [
             "N",
             "NNE",
             "NE",
@@ -292,5 +333,15 @@ class ForecastClient:
             "NW",
             "NNW",
         ]
-        idx = int((d + 11.25) // 22.5) % 16
-        return labels[idx]
+    )
+
+    @classmethod
+    def _deg_to_16pt_vec(cls, deg: "np.ndarray") -> List[str]:
+        """Convert an array of degrees to 16-point compass directions."""
+        idx = ((deg + 11.25) // 22.5).astype(np.int64) % 16
+        return cls._COMPASS[idx].tolist()
+
+    @classmethod
+    def _deg_to_16pt(cls, d: float) -> str:
+        """Convert degrees to 16-point compass direction."""
+        return cls._deg_to_16pt_vec(np.asarray([d]))[0]
@@ -1,7 +1,6 @@
 """Logging configuration for the wind forecast application."""
 
-import json
-import logging.config
+import logging
 import sys
 from pathlib import Path
 from typing import Optional
@@ -15,47 +14,33 @@ def configure_logging(verbose: bool = False, log_file: Optional[Path] = None) ->
         verbose: If True, sets root logger to DEBUG level
         log_file: Optional path to log file. If provided, adds a file handler.
     """
-    from typing import Any, Dict, List
-
-    config: Dict[str, Any] = {
-        "version": 1,
-        "disable_existing_loggers": False,
-        "formatters": {
-            "standard": {
-                "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-                "datefmt": "%Y-%m-%d %H:%M:%S",
-            },
-            "simple": {"format": "%(levelname)s: %(message)s"},
-        },
-        "handlers": {
-            "console": {
-                "class": "logging.StreamHandler",
-                "level": "DEBUG" if verbose else "INFO",
-                "formatter": "standard",
-                "stream": sys.stdout,
-            }
-        },
-        "loggers": {
-            "windforecast": {  # Root package logger
-                "level": "DEBUG" if verbose else "INFO",
-                "handlers": ["console"],
-                "propagate": False,
-            }
-        },
-        "root": {"level": "WARNING", "handlers": ["console"]},  # For all other loggers
-    }
+    # Build handlers imperatively: dictConfig re-imports handler classes by
+    # string and runs its full config state machine for what is two handlers
+    level = logging.DEBUG if verbose else logging.INFO
+    formatter = logging.Formatter(
+        "%(asctime)s [%(levelname)s] %(name)s: %(message)s", "%Y-%m-%d %H:%M:%S"
+    )
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setLevel(level)
+    console.setFormatter(formatter)
+
+    # Package logger gets its own handlers and doesn't propagate
+    pkg_logger = logging.getLogger("windforecast")
+    pkg_logger.handlers.clear()
+    pkg_logger.addHandler(console)
+    pkg_logger.setLevel(level)
+    pkg_logger.propagate = False
 
     if log_file:
         # Add file handler if log_file is specified
-        config["handlers"]["file"] = {
-            "class": "logging.FileHandler",
-            "level": "DEBUG",
-            "formatter": "standard",
-            "filename": str(log_file),
-            "mode": "a",
-        }
-        if isinstance(config["loggers"]["windforecast"]["handlers"], list):
-            config["loggers"]["windforecast"]["handlers"].append("file")
-
-    # Apply configuration
-    logging.config.dictConfig(config)
+        file_handler = logging.FileHandler(str(log_file), mode="a")
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+        pkg_logger.addHandler(file_handler)
+
+    # For all other loggers
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.addHandler(console)
+    root.setLevel(logging.WARNING)
@@ -20,100 +20,337 @@ NEVER use direct file imports or reference files in root directory
 This header ensures AI tools like GitHub Copilot maintain project consistency.
 """
 
+import bisect
+import functools
+import hashlib
+import importlib.util
+import io
 import logging
+import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+from itertools import groupby
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-import pytz
-
+from . import _json
 from .schemas import WindConfig
 
+try:
+    from zoneinfo import ZoneInfo
+
+    # zoneinfo lazy-loads the single zone from the OS tzdata, unlike pytz
+    # which indexes its whole bundled database on first use
+    _CET = ZoneInfo("Europe/Paris")
+except ImportError:  # pragma: no cover - zoneinfo ships with Python 3.9+
+    import pytz
+
+    _CET = pytz.timezone("Europe/Paris")
+
 logger = logging.getLogger(__name__)
 
+
+if sys.version_info >= (3, 11):
+
+    @functools.lru_cache(maxsize=4096)
+    def _parse_iso(iso: str) -> datetime:
+        """Parse an ISO timestamp, accepting a trailing ``Z`` suffix.
+
+        The same timestamp strings are parsed repeatedly while grouping
+        hours, building headers and sorting days, so results are cached.
+        """
+        return datetime.fromisoformat(iso)
+
+else:  # pragma: no cover - fromisoformat only accepts "Z" from 3.11 on
+
+    @functools.lru_cache(maxsize=4096)
+    def _parse_iso(iso: str) -> datetime:
+        """Parse an ISO timestamp, accepting a trailing ``Z`` suffix."""
+        return datetime.fromisoformat(iso.replace("Z", "+00:00"))
+
+
+@functools.lru_cache(maxsize=4096)
+def _hour_label(iso: str) -> str:
+    """HH:MM header label for an ISO timestamp.
+
+    Each hour appears in the header of every day section that contains it
+    (once per view), so the strftime result is cached alongside the parse.
+    """
+    return _parse_iso(iso).strftime("%H:%M")
+
+
+# Star rating per band name. The top band never reaches this mapping (it is
+# forced to 0 in _compile_bands), and unknown band names also score 0.
+_STAR_MAPPING = {
+    "hardcore": 3,  # Challenging conditions
+    "insane": 6,  # Expert conditions (highest rating)
+    "great": 5,  # Perfect conditions
+    "very good": 4,  # Very good conditions
+    "good": 3,  # Good conditions
+    "ok": 2,  # Acceptable conditions
+    "light": 1,  # Light wind conditions
+    "below": 0,  # Too light
+}
+
+
+# Every possible star string (ratings go up to 6 for "insane"), built once
+# instead of repeating the string multiply per cell, plus the wrapped form
+# the table cells embed so the hot loop skips that f-string too
+_STAR_STRINGS = tuple("★" * n for n in range(7))
+_STAR_DIVS = tuple(f'<div class="stars">{stars}</div>' for stars in _STAR_STRINGS)
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_bands(
+    bands: Tuple[Tuple[str, float], ...]
+) -> Tuple[Tuple[float, ...], Tuple[int, ...], Tuple[str, ...]]:
+    """Compile config bands into ascending lookup tables for bisect.
+
+    The config lists bands in descending threshold order; sorting them
+    ascending lets every per-cell lookup be a single binary search instead
+    of a linear scan over the bands. The highest-threshold band marks
+    dangerous conditions and always scores 0 stars, whatever it is named.
+    """
+    ascending = sorted(bands, key=lambda band: band[1])
+    thresholds = tuple(band[1] for band in ascending)
+    stars = tuple(
+        0 if i == len(ascending) - 1 else _STAR_MAPPING.get(band[0], 0)
+        for i, band in enumerate(ascending)
+    )
+    classes = tuple(band[0].lower().replace(" ", "-") for band in ascending)
+    return thresholds, stars, classes
+
+
+@functools.lru_cache(maxsize=4096)
+def _cell_html(
+    cell_classes: str,
+    style_attr: str,
+    dir_deg: float,
+    dir_str: str,
+    wind_kn: float,
+    gust_kn: float,
+    stars_html: str,
+    wave_m: Optional[float],
+    precip_mm_h: float,
+) -> str:
+    """Render one forecast cell.
+
+    Reports repeat identical cells across views and spots (same wind bin,
+    same direction), so the built markup is memoized on the cell content.
+    """
+    return f"""<td class="{cell_classes}"{style_attr}>
+                            <div class="dir">
+                                <span class="dir-arrow" style="transform: rotate({dir_deg + 180}deg)">↑</span>
+                                {dir_str}
+                            </div>
+                            <div class="wind">
+                                {wind_kn:.1f}/{gust_kn:.1f}kt
+                            </div>
+                            {stars_html}
+                            {f'<div class="wave">🌊 {wave_m:.1f}m</div>' if wave_m is not None else ''}
+                            {f'<div class="rain">🌧 {precip_mm_h:.1f}mm</div>' if precip_mm_h > 0 else ''}
+                        </td>"""
+
+
+def _band_css_class(wind_kn: float, bands: List[Tuple[str, float]]) -> str:
+    """Map a wind speed to the CSS class of its wind band."""
+    thresholds, _, classes = _compile_bands(tuple(bands))
+    idx = bisect.bisect_right(thresholds, wind_kn) - 1
+    return classes[idx] if idx >= 0 else "below"
+
+
+def _calculate_stars(wind_kn: float, config: WindConfig) -> int:
+    """Calculate star rating based on wind speed and config bands."""
+    thresholds, stars, _ = _compile_bands(tuple(config.conditions.bands))
+    idx = bisect.bisect_right(thresholds, wind_kn) - 1
+    return stars[idx] if idx >= 0 else 0
+
+
+def _stars_html(count: int) -> str:
+    """Generate HTML for star rating."""
+    if 0 <= count < len(_STAR_STRINGS):
+        return _STAR_STRINGS[count]
+    return "★" * count  # Out of range: negatives still yield ""
+
+
+# Joined class attribute per (band, kiteable) pair, filled lazily. There are
+# only a handful of combinations per config, so every cell after the first
+# of its kind reuses the same string instead of building a list and joining.
+_CLASS_CACHE: Dict[Tuple[str, bool], str] = {}
+
+
+def _cell_class_str(band: str, kiteable: bool) -> str:
+    """Return the joined cell class attribute for a band/kiteable pair."""
+    key = (band, kiteable)
+    classes = _CLASS_CACHE.get(key)
+    if classes is None:
+        suffix = "kiteable" if kiteable else "not-kiteable"
+        classes = _CLASS_CACHE[key] = f"cell-data {band} {suffix}"
+    return classes
+
+
+# Pillow is only needed for the PNG-to-JPEG fallback, so probe for it
+# without importing (find_spec just checks the path) and load the module
+# on first use; HTML-only runs skip the import entirely.
+HAS_PILLOW = importlib.util.find_spec("PIL") is not None
+Image = None  # PIL.Image, resolved lazily by _pillow_image()
+
+
+def _pillow_image():
+    """Import and cache PIL.Image on first use."""
+    global Image, HAS_PILLOW
+    if Image is None and HAS_PILLOW:
+        try:
+            from PIL import Image as _pil_image
+
+            Image = _pil_image
+        except ImportError:
+            HAS_PILLOW = False
+    return Image
+
 try:
-    from PIL import Image
+    import pyvips
 
-    HAS_PILLOW = True
+    HAS_PYVIPS = True
 except ImportError:
-    HAS_PILLOW = False
-    Image = None
+    HAS_PYVIPS = False
+    pyvips = None
+
+try:
+    from playwright.sync_api import sync_playwright
+
+    HAS_PLAYWRIGHT = True
+except ImportError:
+    HAS_PLAYWRIGHT = False
+    sync_playwright = None
 
 
 class ReportRenderer:
     """HTML and image report renderer."""
 
-    def __init__(self, config: Optional[WindConfig] = None, template_dir: Optional[Path] = None):
+    # Templates pre-split around their placeholders, shared across renderer
+    # instances: {path: (mtime_ns, (head, middle, tail))}
+    _TEMPLATE_CACHE: Dict[str, Tuple[int, Tuple[str, str, str]]] = {}
+
+    @classmethod
+    def _get_template(cls, path: Path) -> Tuple[str, str, str]:
+        """Load a template split around its two placeholders, cached on mtime.
+
+        Returns (head, middle, tail) where head precedes the
+        ``<!-- FORECAST_DATA -->`` marker, middle sits between it and
+        ``<!-- GENERATED_AT -->``, and tail follows. Batch runs rendering
+        several reports from the same template then skip the re-read and
+        re-scan entirely; editing the template invalidates the entry.
+        """
+        key = str(path)
+        mtime_ns = path.stat().st_mtime_ns
+        cached = cls._TEMPLATE_CACHE.get(key)
+        if cached is None or cached[0] != mtime_ns:
+            template = path.read_text()
+            head, _, rest = template.partition("<!-- FORECAST_DATA -->")
+            middle, _, tail = rest.partition("<!-- GENERATED_AT -->")
+            cached = (mtime_ns, (head, middle, tail))
+            cls._TEMPLATE_CACHE[key] = cached
+        return cached[1]
+
+    def __init__(
+        self,
+        config: Optional[WindConfig] = None,
+        template_dir: Optional[Path] = None,
+        jpeg_quality: int = 85,
+        device_scale: Optional[float] = None,
+        cache_dir: Optional[Path] = None,
+    ):
         """Initialize renderer with optional config and custom template directory.
 
         Args:
             config: WindConfig object containing wind band thresholds
             template_dir: Path to custom HTML templates. If None, uses built-in templates.
+            jpeg_quality: JPEG quality for generated images. The default of 85
+                is visually indistinguishable for report tables and encodes
+                much faster and smaller than 100; pass 95+ for near-lossless
+                output (which also disables chroma subsampling).
+            device_scale: Optional Chrome device scale factor for high-DPI
+                screenshots. None leaves Chrome at its default scale.
+            cache_dir: Optional directory for a content-addressed render
+                cache. When set, render_html keyed on a hash of the input
+                data reuses the previously rendered file for identical
+                snapshots (useful when iterating on the same data); None
+                disables caching.
         """
         self.config = config
         self.template_dir = template_dir or (Path(__file__).parent / "templates")
-
-    def _calculate_stars(self, wind_kn: float, config: WindConfig) -> int:
-        """Calculate star rating based on wind speed and config bands."""
-        bands = config.conditions.bands
-
-        # Skip "too much" (dangerous conditions)
-        if wind_kn >= bands[0][1]:  # Above "too much" threshold
-            return 0
-
-        star_mapping = {
-            "hardcore": 3,  # Challenging conditions
-            "insane": 6,  # Expert conditions (highest rating)
-            "great": 5,  # Perfect conditions
-            "very good": 4,  # Very good conditions
-            "good": 3,  # Good conditions
-            "ok": 2,  # Acceptable conditions
-            "light": 1,  # Light wind conditions
-            "below": 0,  # Too light
-        }
-
-        # Find the appropriate band
-        for band_name, threshold in bands:
-            if wind_kn >= threshold:
-                return star_mapping.get(band_name, 0)
-        return 0
-
-    @staticmethod
-    def _stars_html(count: int) -> str:
-        """Generate HTML for star rating."""
-        return "★" * count
+        self.jpeg_quality = jpeg_quality
+        self.device_scale = device_scale
+        self.cache_dir = cache_dir
+        # Persistent Playwright browser, started lazily on first screenshot
+        self._playwright = None
+        self._browser = None
+        # Discovered renderer executables, remembered once found so batch
+        # runs don't repeat the PATH walk and stat calls
+        self._chrome_path: Optional[str] = None
+        self._wk_path: Optional[str] = None
+        # Viewport of the last report this renderer wrote, keyed by path, so
+        # generate_jpg can skip re-reading and re-measuring its own output
+        self._viewport_hint: Optional[Tuple[Path, Tuple[int, int]]] = None
+
+    # Pure helpers live at module level (no self, cache-friendly, no bound
+    # method per call in the hot loops); kept on the class for back-compat
+    _calculate_stars = staticmethod(_calculate_stars)
+    _stars_html = staticmethod(_stars_html)
 
     def _generate_daily_summary(
-        self, data: Dict[str, Any], spots: List[str], all_forecasts: Dict[str, Dict[str, Any]]
+        self,
+        data: Dict[str, Any],
+        spots: List[str],
+        all_forecasts: Dict[str, Dict[str, Any]],
+        config: Optional[WindConfig] = None,
     ) -> Optional[str]:
         """Generate a summary section with daily highlights."""
-        days_data: Dict[date, Dict[str, List[Dict[str, Any]]]] = {}
+        # Running aggregates per (day, spot): no per-forecast dicts, one
+        # accumulator holding [count, wind_sum, max_gust, best_stars,
+        # first_hour, last_hour] updated in a single pass.
+        days_data: Dict[date, Dict[str, List[Any]]] = defaultdict(dict)
 
         # Group forecasts by day and spot
         for time, spots_data in all_forecasts.items():
-            dt = datetime.fromisoformat(time.replace("Z", "+00:00"))
-            day = dt.date()
-
-            if day not in days_data:
-                days_data[day] = {}
+            # Indexing creates the day entry even without kiteable rows, so
+            # hours-without-wind still yield an (empty) summary, not None
+            day_data = days_data[_parse_iso(time).date()]
+            label: Optional[str] = None
 
             for spot, forecast in spots_data.items():
                 if forecast["kiteable"]:
-                    if spot not in days_data[day]:
-                        days_data[day][spot] = []
-                    days_data[day][spot].append(
-                        {
-                            "time": dt,
-                            "wind_kn": forecast["wind_kn"],
-                            "gust_kn": forecast["gust_kn"],
-                            "stars": self._calculate_stars(
-                                forecast["wind_kn"], WindConfig.model_validate(data["config"])
-                            ),
-                        }
-                    )
+                    # Validate the config at most once when not handed the
+                    # one render_html already built
+                    if config is None:
+                        config = WindConfig.model_validate(data["config"])
+                    if label is None:
+                        label = _hour_label(time)
+                    wind_kn = forecast["wind_kn"]
+                    gust_kn = forecast["gust_kn"]
+                    stars = _calculate_stars(wind_kn, config)
+                    acc = day_data.get(spot)
+                    if acc is None:
+                        day_data[spot] = [1, wind_kn, gust_kn, stars, label, label]
+                    else:
+                        acc[0] += 1
+                        acc[1] += wind_kn
+                        if gust_kn > acc[2]:
+                            acc[2] = gust_kn
+                        if stars > acc[3]:
+                            acc[3] = stars
+                        # HH:MM labels compare chronologically as strings
+                        if label < acc[4]:
+                            acc[4] = label
+                        elif label > acc[5]:
+                            acc[5] = label
 
         if not days_data:
             return None
@@ -122,19 +359,12 @@ class ReportRenderer:
         sections = []
         for day, spots_data in sorted(days_data.items()):
             day_spots = []
-            for spot, forecasts in spots_data.items():
-                best_forecast = max(forecasts, key=lambda f: f["stars"])
-                avg_wind = sum(f["wind_kn"] for f in forecasts) / len(forecasts)
-                max_gust = max(f["gust_kn"] for f in forecasts)
-
-                hours = sorted([f["time"].strftime("%H:%M") for f in forecasts])
-                time_range = f"{hours[0]}-{hours[-1]}"
-
+            for spot, (count, wind_sum, max_gust, best_stars, first, last) in spots_data.items():
                 spot_html = f"""<li>
-                    <strong>{spot}</strong>: {len(forecasts)} kiteable hours ({time_range})
+                    <strong>{spot}</strong>: {count} kiteable hours ({first}-{last})
                     <div class="stats">
-                        Avg wind: {avg_wind:.1f}kt, Max gust: {max_gust:.1f}kt
-                        <div class="stars">{self._stars_html(best_forecast["stars"])}</div>
+                        Avg wind: {wind_sum / count:.1f}kt, Max gust: {max_gust:.1f}kt
+                        <div class="stars">{_stars_html(best_stars)}</div>
                     </div>
                 </li>"""
                 day_spots.append(spot_html)
@@ -155,100 +385,103 @@ class ReportRenderer:
 
     def render_html(self, data: Dict[str, Any], output_path: Path) -> None:
         """Render forecast data to HTML report."""
-        with open(self.template_dir / "report.html") as f:
-            template = f.read()
-
-        # Collect all forecast data and count kiteable hours per spot
-        all_forecasts: Dict[str, Dict[str, Any]] = {}
-        spot_kiteable_count: Dict[str, int] = {}
+        # Content-addressed cache: identical snapshots (the generated_at
+        # stamp is part of the data) render to identical reports, so a hit
+        # is a plain file copy.
+        cache_path: Optional[Path] = None
+        if self.cache_dir is not None:
+            digest = hashlib.sha256(_json.dumps_canonical(data)).hexdigest()
+            cache_path = self.cache_dir / f"{digest}.html"
+            if cache_path.is_file():
+                shutil.copyfile(cache_path, output_path)
+                return
+
+        head, middle, tail = self._get_template(self.template_dir / "report.html")
+
+        # Validate the config once; it is identical for every cell. Done
+        # lazily so reports without any rows don't require a full config.
+        config: Optional[WindConfig] = None
+
+        # Collect every per-view structure in a single traversal of the rows.
+        # Stars and band class only depend on the row itself, so compute them
+        # once per row here instead of once per rendered cell. Cells are keyed
+        # by (spot, hour) directly: one dict probe per rendered cell instead
+        # of two nested ones.
+        all_forecasts: Dict[str, Dict[str, Any]] = {}  # {hour: {spot: row}}, for the summary
+        cell_meta: Dict[Tuple[str, str], Tuple[int, str]] = {}  # {(time, spot): (stars, band)}
+        kiteable_cells: Dict[Tuple[str, str], Dict[str, Any]] = {}  # Only kiteable conditions
+        all_cells: Dict[Tuple[str, str], Dict[str, Any]] = {}  # All conditions
+        spot_kiteable_hours: Dict[date, Dict[str, Set[str]]] = {}  # {date: {spot: set(hours)}}
+        kiteable_hours_by_day: Dict[date, Set[str]] = {}  # {date: set(hours)}
+        all_hours: Set[str] = set()
 
         for spot in data["spots"]:
-            kiteable_count = 0
+            spot_name = spot["spot"]
             for r in spot["rows"]:
-                time = r["time"]
-                if time not in all_forecasts:
-                    all_forecasts[time] = {}
-                all_forecasts[time][spot["spot"]] = r
+                if config is None:
+                    config = WindConfig.model_validate(data["config"])
+                hour = r["time"]
+                all_hours.add(hour)
+                all_forecasts.setdefault(hour, {})[spot_name] = r
+                all_cells[(spot_name, hour)] = r
                 if r["kiteable"]:
-                    kiteable_count += 1
-            spot_kiteable_count[spot["spot"]] = kiteable_count  # Include all spots
+                    day = _parse_iso(hour).date()
+                    kiteable_cells[(spot_name, hour)] = r
+                    spot_kiteable_hours.setdefault(day, {}).setdefault(spot_name, set()).add(hour)
+                    kiteable_hours_by_day.setdefault(day, set()).add(hour)
+                    stars = _calculate_stars(r["wind_kn"], config)
+                else:
+                    stars = 0
+                band = _band_css_class(r["wind_kn"], config.conditions.bands)
+                cell_meta[(hour, spot_name)] = (stars, band)
 
-        # Initialize spot and hour tracking
         all_spots = {spot["spot"] for spot in data["spots"]}
-        all_hours = {row["time"] for spot in data["spots"] for row in spot["rows"]}
 
-        # Create data structures for different views
-        kiteable_forecasts: Dict[str, Dict[str, Any]] = {}  # Only kiteable conditions
-        all_forecasts_clean: Dict[str, Dict[str, Any]] = {}  # All conditions
-        spot_tables: List[str] = []  # Initialize tables list
-        kiteable_tables: List[str] = []  # Initialize kiteable conditions tables
-        all_tables: List[str] = []  # Initialize all conditions tables
+        # Bucket hours by day in one pass. ISO strings sort chronologically,
+        # so sorting once up front keeps every bucket (and the day order)
+        # sorted, and groupby can slice the consecutive runs without a
+        # setdefault probe per hour.
+        hours_by_day: Dict[date, List[str]] = {
+            day: list(group)
+            for day, group in groupby(sorted(all_hours), key=lambda h: _parse_iso(h).date())
+        }
 
-        # Track kiteable hours per day for each spot
-        spot_kiteable_hours: Dict[date, Dict[str, Set[str]]] = {}  # {date: {spot: set(hours)}}
-        kiteable_hours_by_day: Dict[date, Set[str]] = (
-            {}
-        )  # {date: set(hours)}        # Process forecasts and organize by views
-        for hour in all_hours:
-            dt = datetime.fromisoformat(hour.replace("Z", "+00:00"))
-            day = dt.date()
-
-            # Initialize data structures if needed
-            if hour not in kiteable_forecasts:
-                kiteable_forecasts[hour] = {}
-                all_forecasts_clean[hour] = {}
-
-            if day not in spot_kiteable_hours:
-                spot_kiteable_hours[day] = {}
-                kiteable_hours_by_day[day] = set()
-
-            for spot in all_spots:
-                if hour in all_forecasts and spot in all_forecasts[hour]:
-                    forecast = all_forecasts[hour][spot]
-                    # Add to all conditions view
-                    all_forecasts_clean[hour][spot] = forecast
-
-                    # Track kiteable conditions
-                    if forecast["kiteable"]:
-                        kiteable_forecasts[hour][spot] = forecast
-                        # Initialize spot in tracking if needed
-                        if spot not in spot_kiteable_hours[day]:
-                            spot_kiteable_hours[day][spot] = set()
-                        # Add hour to spot's kiteable hours for the day
-                        spot_kiteable_hours[day][spot].add(hour)
-                        kiteable_hours_by_day[day].add(hour)
-
-        # Remove hours with no kiteable conditions from kiteable view
-        kiteable_forecasts = {hour: spots for hour, spots in kiteable_forecasts.items() if spots}
+        # Days without any kiteable hour still need (empty) entries for the
+        # per-section lookups below
+        for day in hours_by_day:
+            spot_kiteable_hours.setdefault(day, {})
+            kiteable_hours_by_day.setdefault(day, set())
+
+        # The sets above answer membership tests; sort each day's kiteable
+        # hours once so the kiteable view doesn't re-sort per section
+        sorted_kiteable_hours: Dict[date, List[str]] = {
+            day: sorted(hours) for day, hours in kiteable_hours_by_day.items()
+        }
 
         # Get all spots that have at least one kiteable condition
         kiteable_spots = {
             spot for day_data in spot_kiteable_hours.values() for spot in day_data.keys()
         }
 
-        # Generate tables for each day and each view
-        spot_tables.clear()
-        kiteable_tables.clear()
-        all_tables.clear()
-
-        if not kiteable_spots:
-            kiteable_tables.append("<p>No kiteable conditions found.</p>")
+        # Table dimensions, tracked while rendering so the JPG step can size
+        # its viewport from an HTML comment instead of re-parsing the document.
+        # The lock only matters when day sections render in parallel below.
+        max_cols = 0
+        total_rows = 0
+        n_sections = 0
+        metrics_lock = threading.Lock()
 
         # Function to generate daily table content
         def generate_table_section(
-            day: date, forecast_data: Dict[str, Dict[str, Any]], view_type: str
+            day: date, cells: Dict[Tuple[str, str], Dict[str, Any]], view_type: str
         ) -> str:
             # Get hours for this day based on view type
             if view_type == "kiteable":
                 # For kiteable view, only include hours with kiteable conditions
-                day_hours = sorted(hour for hour in kiteable_hours_by_day[day])
+                day_hours = sorted_kiteable_hours[day]
             else:
                 # For all-conditions view, include all hours for the day
-                day_hours = sorted(
-                    hour
-                    for hour in all_hours
-                    if datetime.fromisoformat(hour.replace("Z", "+00:00")).date() == day
-                )
+                day_hours = hours_by_day.get(day, [])
 
             if not day_hours:
                 return ""
@@ -269,52 +502,48 @@ class ReportRenderer:
                     reverse=True,
                 )
 
-            rows = []
+            nonlocal max_cols, total_rows, n_sections
+            with metrics_lock:
+                n_sections += 1
+                max_cols = max(max_cols, len(day_hours) + 1)
+                total_rows += len(daily_spots) + 1
+
+            buf = io.StringIO()
+            w = buf.write
 
             # Generate header row
-            header_cells = ["<th>Spot</th>"]
+            w("<tr><th>Spot</th>")
             for hour in day_hours:
-                dt = datetime.fromisoformat(hour.replace("Z", "+00:00"))
-                header_classes = ["hour-header"]
                 # For kiteable view, all hours are kiteable. For all view, mark non-kiteable hours
                 if view_type == "all" and hour not in kiteable_hours_by_day[day]:
-                    header_classes.append("no-kiteable")
-                header_cells.append(
-                    f'<th data-hour="{hour}" class="{" ".join(header_classes)}">'
-                    f'{dt.strftime("%H:%M")}</th>'
-                )
-            rows.append(f"<tr>{''.join(header_cells)}</tr>")
-
-            # Generate data rows
+                    header_classes = "hour-header no-kiteable"
+                else:
+                    header_classes = "hour-header"
+                w(f'<th data-hour="{hour}" class="{header_classes}">{_hour_label(hour)}</th>')
+            w("</tr>")
+
+            # Generate data rows. Whether a spot has any kiteable hour today
+            # is already known from spot_kiteable_hours, so the row class can
+            # be emitted before its cells.
+            day_kiteable_spots = spot_kiteable_hours[day]
             for spot in daily_spots:
-                cells = [f"<td class='spotcol'><strong>{spot}</strong></td>"]
-                spot_has_kiteable = False
+                # For all view, mark spots with no kiteable hours
+                if view_type == "all" and spot not in day_kiteable_spots:
+                    row_classes = "spot-row no-kiteable-spot"
+                else:
+                    row_classes = "spot-row"
+                w(f"<tr class='{row_classes}'>")
+                w(f"<td class='spotcol'><strong>{spot}</strong></td>")
 
                 for hour in day_hours:
-                    if hour in forecast_data and spot in forecast_data[hour]:
-                        r = forecast_data[hour][spot]
-                        config = WindConfig.model_validate(data["config"])
-                        stars = self._calculate_stars(r["wind_kn"], config) if r["kiteable"] else 0
-                        stars_html = (
-                            f'<div class="stars">{self._stars_html(stars)}</div>'
-                            if r["kiteable"]
-                            else ""
-                        )
-
-                        # Determine wind band
-                        wind_band = "below"
-                        for band_name, threshold in config.conditions.bands:
-                            if r["wind_kn"] >= threshold:
-                                wind_band = band_name.lower().replace(" ", "-")
-                                break
+                    r = cells.get((spot, hour))
+                    if r is not None:
+                        stars, wind_band = cell_meta[(hour, spot)]
+                        stars_html = _STAR_DIVS[stars] if r["kiteable"] else ""
 
-                        cell_classes = ["cell-data", wind_band]
+                        cell_classes = _cell_class_str(wind_band, r["kiteable"])
                         style_attr = ""
-                        if r["kiteable"]:
-                            cell_classes.append("kiteable")
-                            spot_has_kiteable = True
-                        else:
-                            cell_classes.append("not-kiteable")
+                        if not r["kiteable"]:
                             # Only hide non-kiteable cells in the kiteable view
                             if view_type == "kiteable" and hour in kiteable_hours_by_day[day]:
                                 style_attr = ' style="display: none;"'
@@ -322,87 +551,44 @@ class ReportRenderer:
                         # Get dir_deg from the field if present, otherwise 0
                         dir_deg = r.get("dir_deg", 0)  # Default to 0° (North) if not specified
 
-                        cell_html = f"""<td class="{' '.join(cell_classes)}"{style_attr}>
-                            <div class="dir">
-                                <span class="dir-arrow" style="transform: rotate({dir_deg + 180}deg)">↑</span>
-                                {r['dir']}
-                            </div>
-                            <div class="wind">
-                                {r["wind_kn"]:.1f}/{r["gust_kn"]:.1f}kt
-                            </div>
-                            {stars_html}
-                            {f'<div class="wave">🌊 {r["wave_m"]:.1f}m</div>' if r['wave_m'] is not None else ''}
-                            {f'<div class="rain">🌧 {r["precip_mm_h"]:.1f}mm</div>' if r['precip_mm_h'] > 0 else ''}
-                        </td>"""
-                        cells.append(cell_html)
+                        w(
+                            _cell_html(
+                                cell_classes,
+                                style_attr,
+                                dir_deg,
+                                r["dir"],
+                                r["wind_kn"],
+                                r["gust_kn"],
+                                stars_html,
+                                r["wave_m"],
+                                r["precip_mm_h"],
+                            )
+                        )
                     else:
-                        cells.append('<td class="no-data">—</td>')
+                        w('<td class="no-data">—</td>')
 
-                # Add row with appropriate classes
-                row_classes = ["spot-row"]
-                # For all view, mark spots with no kiteable hours
-                if view_type == "all" and not spot_has_kiteable:
-                    row_classes.append("no-kiteable-spot")
-
-                rows.append(f"<tr class='{' '.join(row_classes)}'>{''.join(cells)}</tr>")
+                w("</tr>")
 
             day_str = day.strftime("%A, %d %B")
             return f"""<div class="day-section">
                 <h2>{day_str}</h2>
                 <div class="table-container">
                     <table class="forecast-table">
-                        {''.join(rows)}
+                        {buf.getvalue()}
                     </table>
                 </div>
             </div>"""
 
-        # Generate tables for each day and each view
-        all_days = sorted(
-            {datetime.fromisoformat(h.replace("Z", "+00:00")).date() for h in all_hours}
-        )
+        all_days = list(hours_by_day)
 
-        # Start with fresh lists
-        spot_tables.clear()
-        kiteable_tables.clear()
-        all_tables.clear()
-
-        # Generate daily summary
-        daily_summary = self._generate_daily_summary(data, list(all_spots), all_forecasts)
-        if daily_summary:
-            kiteable_tables.append(daily_summary)
-            all_tables.append(daily_summary)
-
-        # Handle case of no kiteable spots
-        if not kiteable_spots:
-            kiteable_tables.append("<p>No kiteable conditions found.</p>")
-
-        # Generate tables for each day and view
-        for day in all_days:
-            # Generate tables for each view
-            kiteable_section = generate_table_section(day, kiteable_forecasts, "kiteable")
-            all_section = generate_table_section(day, all_forecasts_clean, "all")
-
-            if kiteable_section:
-                kiteable_tables.append(kiteable_section)
-            if all_section:
-                all_tables.append(all_section)
-
-        # Create view divs
-        spot_tables.append(
-            f"""
-            <div id="kiteable-view">
-                {''.join(kiteable_tables)}
-            </div>
-            <div id="all-conditions-view">
-                {''.join(all_tables)}
-            </div>"""
-        )
+        # Generate daily summary, shown at the top of both views
+        daily_summary = self._generate_daily_summary(data, list(all_spots), all_forecasts, config)
 
-        # Add model updates section at the end of both views
+        # Model updates section shown at the end of both views
         model_info = []
         for model_id, info in data.get("model_updates", {}).items():
             if info.get("run"):
-                run_time = datetime.fromisoformat(info["run"].replace("Z", "+00:00"))
+                run_time = _parse_iso(info["run"])
                 model_info.append(
                     f"""<div class="model-info">
                         <span class="model-name">{info['title']}</span>
@@ -410,53 +596,138 @@ class ReportRenderer:
                     </div>"""
                 )
 
-        if model_info:
-            updates_section = f"""<div class="model-updates">
+        # Convert generated_at timestamp to CET
+        generated_at = _parse_iso(data["generated_at"])
+        generated_at_cet = generated_at.astimezone(_CET)
+
+        # Stream the document around the pre-split template pieces. Day
+        # sections are written to disk as they are produced in a single pass
+        # over the days; only the all-conditions sections are buffered until
+        # the kiteable view is complete, instead of holding every rendered
+        # table in nested lists and joining them repeatedly.
+        with open(output_path, "wb", buffering=1 << 16) as f:
+
+            def w(fragment: str) -> None:
+                f.write(fragment.encode("utf-8"))
+
+            w(head)
+            w('\n            <div id="kiteable-view">\n                ')
+            if daily_summary:
+                w(daily_summary)
+            if not kiteable_spots:
+                w("<p>No kiteable conditions found.</p>")
+
+            # Day sections are independent once the prep pass is done. On
+            # free-threaded builds render them in parallel; with the GIL the
+            # threads would only serialize, so stream them in one pass.
+            gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+            if not gil_enabled and len(all_days) > 1:
+                workers = min(len(all_days), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    kiteable_sections = list(
+                        executor.map(
+                            lambda d: generate_table_section(d, kiteable_cells, "kiteable"),
+                            all_days,
+                        )
+                    )
+                    all_sections = [
+                        section
+                        for section in executor.map(
+                            lambda d: generate_table_section(d, all_cells, "all"), all_days
+                        )
+                        if section
+                    ]
+                for section in kiteable_sections:
+                    if section:
+                        w(section)
+            else:
+                all_sections = []
+                for day in all_days:
+                    section = generate_table_section(day, kiteable_cells, "kiteable")
+                    if section:
+                        w(section)
+                    section = generate_table_section(day, all_cells, "all")
+                    if section:
+                        all_sections.append(section)
+
+            w('\n            </div>\n            <div id="all-conditions-view">\n                ')
+            if daily_summary:
+                w(daily_summary)
+            for section in all_sections:
+                w(section)
+            w("\n            </div>")
+
+            if model_info:
+                w(
+                    f"""\n<div class="model-updates">
                 <h3>Forecast Model Updates</h3>
                 {''.join(model_info)}
             </div>"""
-            spot_tables.append(updates_section)
+                )
 
-        # Convert generated_at timestamp to CET
-        generated_at = datetime.fromisoformat(data["generated_at"].replace("Z", "+00:00"))
-        cet = pytz.timezone("Europe/Paris")
-        generated_at_cet = generated_at.astimezone(cet)
+            # Embed the tracked table dimensions so _calculate_viewport can
+            # read them back with a regex instead of a full DOM parse
+            w(f"\n<!-- VIEWPORT COLS:{max_cols} ROWS:{total_rows} SECTIONS:{n_sections} -->")
+
+            w(middle)
+            w(generated_at_cet.strftime("%Y-%m-%dT%H:%M:%S%z (CET)"))
+            w(tail)
 
-        content = template.replace("<!-- FORECAST_DATA -->", "\n".join(spot_tables)).replace(
-            "<!-- GENERATED_AT -->", generated_at_cet.strftime("%Y-%m-%dT%H:%M:%S%z (CET)")
+        self._viewport_hint = (
+            output_path.absolute(),
+            self._viewport_from_metrics(max_cols, total_rows, n_sections),
         )
 
-        output_path.write_text(content)
+        if cache_path is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, cache_path)
+
+    _VIEWPORT_COMMENT = re.compile(r"<!-- VIEWPORT COLS:(\d+) ROWS:(\d+) SECTIONS:(\d+) -->")
 
     def _calculate_viewport(self, html_content: str) -> Tuple[int, int]:
         """Calculate optimal viewport size based on table content."""
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(html_content, "html.parser")
-        max_columns = 0
-        total_height = 0
-
-        # Calculate dimensions from all day sections
-        day_sections = soup.find_all("div", class_="day-section")
-        for section in day_sections:
-            table = section.find("table")
-            if table:
-                rows = table.find_all("tr")
-                if rows:
-                    # Count columns in first row (header)
-                    columns = len(rows[0].find_all(["th", "td"]))
-                    max_columns = max(max_columns, columns)
-                    total_height += len(rows) * 40  # Approximate height per row
-
-        # Calculate dimensions
+        # Reports written by render_html carry their table dimensions in a
+        # comment; reading it back is a single regex scan instead of a DOM
+        # parse of the whole document.
+        match = self._VIEWPORT_COMMENT.search(html_content)
+        if match:
+            max_columns = int(match.group(1))
+            total_rows = int(match.group(2))
+            n_sections = int(match.group(3))
+        else:
+            # Externally produced HTML: fall back to parsing the tables
+            from bs4 import BeautifulSoup
+
+            soup = BeautifulSoup(html_content, "html.parser")
+            max_columns = 0
+            total_rows = 0
+
+            # Calculate dimensions from all day sections
+            day_sections = soup.find_all("div", class_="day-section")
+            for section in day_sections:
+                table = section.find("table")
+                if table:
+                    rows = table.find_all("tr")
+                    if rows:
+                        # Count columns in first row (header)
+                        columns = len(rows[0].find_all(["th", "td"]))
+                        max_columns = max(max_columns, columns)
+                        total_rows += len(rows)
+            n_sections = len(day_sections)
+
+        return self._viewport_from_metrics(max_columns, total_rows, n_sections)
+
+    @staticmethod
+    def _viewport_from_metrics(
+        max_columns: int, total_rows: int, n_sections: int
+    ) -> Tuple[int, int]:
+        """Map table dimensions to a clamped viewport size."""
         # Base width per column (minimum 100px)
         column_width = 100
         # First column is narrower (60px) and we add some padding
         width = 60 + (max_columns - 1) * column_width + 40  # +40px for padding
-        # Add height for headers, padding, and other elements
-        height = total_height + (
-            len(day_sections) * 100
-        )  # 100px extra per section for header and margins
+        # Approximate 40px per row plus 100px per section for header/margins
+        height = total_rows * 40 + n_sections * 100
 
         # Ensure minimum dimensions and reasonable maximum
         width = max(800, min(width, 7200))
@@ -470,15 +741,30 @@ class ReportRenderer:
         """Generate JPG image from HTML report with dynamic resolution."""
         logger.info(f"Generating JPG from {html_path}")
 
-        # Calculate viewport size from content if not provided
+        # Calculate viewport size from content if not provided. If this
+        # renderer just wrote the report, the size is already known and the
+        # file doesn't need to be read back at all.
         if viewport is None:
-            content = html_path.read_text()
-            viewport = self._calculate_viewport(content)
+            hint = self._viewport_hint
+            if hint is not None and hint[0] == html_path.absolute():
+                viewport = hint[1]
+            else:
+                content = html_path.read_text()
+                viewport = self._calculate_viewport(content)
             logger.info(f"Calculated viewport size: {viewport[0]}x{viewport[1]}")
 
+        # A persistent Playwright browser amortizes Chrome startup across
+        # runs and screenshots straight to JPEG, skipping the PNG round-trip
+        if HAS_PLAYWRIGHT and self._try_playwright(html_path, jpg_path, viewport):
+            return True
+
         # Check if any renderer is available
-        chrome_path = self._find_chrome()
-        wk_path = shutil.which("wkhtmltoimage")
+        chrome_path = self._chrome_path or self._find_chrome()
+        if chrome_path:
+            self._chrome_path = chrome_path
+        wk_path = self._wk_path or shutil.which("wkhtmltoimage")
+        if wk_path:
+            self._wk_path = wk_path
 
         if not chrome_path and not wk_path:
             logger.error("Could not find a renderer (Chrome/Chromium or wkhtmltoimage)")
@@ -495,6 +781,43 @@ class ReportRenderer:
         logger.error("Rendering attempts failed")
         return False
 
+    def _try_playwright(
+        self, html_path: Path, jpg_path: Path, viewport: Tuple[int, int]
+    ) -> bool:
+        """Try generating image with a persistent Playwright browser."""
+        try:
+            if self._browser is None:
+                self._playwright = sync_playwright().start()
+                self._browser = self._playwright.chromium.launch(
+                    args=["--disable-gpu", "--hide-scrollbars"]
+                )
+            page = self._browser.new_page(
+                viewport={"width": viewport[0], "height": viewport[1]}
+            )
+            try:
+                page.goto(f"file://{html_path.absolute()}")
+                page.screenshot(
+                    path=str(jpg_path.absolute()),
+                    type="jpeg",
+                    quality=self.jpeg_quality,
+                    full_page=True,
+                )
+            finally:
+                page.close()
+            return True
+        except Exception as e:
+            logger.error(f"Playwright screenshot failed: {e}")
+            return False
+
+    def close(self) -> None:
+        """Shut down the persistent browser, if one was started."""
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
     def _find_chrome(self) -> Optional[str]:
         """Find Chrome/Chromium executable."""
         # Standard executable names
@@ -530,22 +853,42 @@ class ReportRenderer:
                 "--disable-gpu",
                 f"--window-size={viewport[0]},{viewport[1]}",
                 "--hide-scrollbars",
-                "--force-device-scale-factor=1.0",  # Full resolution
                 "--screenshot=" + str(tmp_png),
                 "--disable-features=TranslateUI",  # Disable UI elements that might affect rendering
-                "--high-dpi-support=1",  # Enable high DPI support
                 "--enable-high-resolution-time",  # Better timing for rendering
                 "--full-page",  # Capture full page height
                 "--no-margins",  # Remove any margins from the screenshot
                 "--virtual-time-budget=1000",  # Allow time for full page rendering
                 f"file://{html_abs}",
             ]
-            subprocess.run(cmd, check=True, capture_output=True)
-
-            if HAS_PILLOW:
-                img = Image.open(tmp_png)  # type: ignore
-                rgb = img.convert("RGB")
-                rgb.save(jpg_abs, "JPEG", quality=100, optimize=True, subsampling=0)
+            if self.device_scale is not None:
+                # High-DPI output is opt-in; forcing a scale factor inflates
+                # the bitmap Chrome has to rasterize and encode
+                cmd.insert(-1, f"--force-device-scale-factor={self.device_scale}")
+            # Chrome is chatty on stdout (GPU/compositor noise); drop it and
+            # keep only stderr, which the error handler reports on failure
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+            if HAS_PYVIPS:
+                # libvips streams the conversion instead of decoding the
+                # whole PNG into memory first
+                img = pyvips.Image.new_from_file(str(tmp_png), access="sequential")
+                img.write_to_file(f"{jpg_abs}[Q={self.jpeg_quality},strip]")
+                tmp_png.unlink()
+                return True
+            elif HAS_PILLOW and (pil := _pillow_image()) is not None:
+                img = pil.open(tmp_png)  # type: ignore
+                try:
+                    # Only copy to RGB when the screenshot actually has alpha
+                    rgb = img if img.mode == "RGB" else img.convert("RGB")
+                    # 4:2:0 chroma subsampling halves encode work and file
+                    # size; keep full chroma only for near-lossless settings
+                    subsampling = 0 if self.jpeg_quality >= 95 else 2
+                    rgb.save(jpg_abs, "JPEG", quality=self.jpeg_quality, subsampling=subsampling)
+                finally:
+                    # Release the decoder buffers as soon as the JPEG is
+                    # written instead of waiting for garbage collection
+                    img.close()
                 tmp_png.unlink()
                 return True
             elif sys.platform == "darwin":
@@ -584,10 +927,11 @@ class ReportRenderer:
         logger.info(f"Generating PDF from {html_path}")
 
         # Check if Chrome is available
-        chrome_path = self._find_chrome()
+        chrome_path = self._chrome_path or self._find_chrome()
         if not chrome_path:
             logger.error("Could not find Chrome/Chromium for PDF generation")
             return False
+        self._chrome_path = chrome_path
 
         try:
             cmd = [
@@ -607,8 +951,11 @@ class ReportRenderer:
                 f"file://{html_path.absolute()}",
             ]
 
-            # Run Chrome in headless mode to generate the PDF
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            # Run Chrome in headless mode to generate the PDF; stdout is
+            # only renderer noise, stderr is kept for the error handler
+            result = subprocess.run(
+                cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+            )
 
             # Check if the PDF was created
             if not pdf_path.exists():
@@ -18,12 +18,36 @@ def test_load_config_valid(config_file):
     assert config.forecast.model == "arome_france_hd"
 
 
+def test_load_config_trusted_round_trip(config_file):
+    """Test that a trusted load reconstructs the same config as a validated one."""
+    validated = load_config(config_file)
+    trusted = load_config(config_file, trusted=True)
+
+    assert isinstance(trusted, WindConfig)
+    assert trusted.model_dump() == validated.model_dump()
+
+
 def test_load_config_missing_file():
     """Test error handling when config file is missing."""
     with pytest.raises(FileNotFoundError):
         load_config(Path("/nonexistent/config.json"))
 
 
+def test_load_config_relative_path_chdir(tmp_path, monkeypatch, sample_config_data):
+    """Relative paths must not serve a cached config for a different file."""
+    for name in ("Spot A", "Spot B"):
+        subdir = tmp_path / name.replace(" ", "_").lower()
+        subdir.mkdir()
+        data = dict(sample_config_data, spots=[dict(sample_config_data["spots"][0], name=name)])
+        (subdir / "config.json").write_text(json.dumps(data))
+
+    monkeypatch.chdir(tmp_path / "spot_a")
+    assert load_config(Path("config.json")).spots[0].name == "Spot A"
+
+    monkeypatch.chdir(tmp_path / "spot_b")
+    assert load_config(Path("config.json")).spots[0].name == "Spot B"
+
+
 def test_invalid_json(tmp_path):
     """Test error handling for invalid JSON."""
     config_path = tmp_path / "config.json"
@@ -35,7 +35,7 @@ def test_fetch_forecasts_api_error(config_file, status_code, expected_error):
     mock_response.status_code = status_code
     mock_response.raise_for_status.side_effect = Exception(expected_error)
 
-    with patch("requests.get", return_value=mock_response):
+    with patch("requests.Session.get", return_value=mock_response):
         with pytest.raises(Exception, match=expected_error):
             client.fetch_forecasts()
 
@@ -45,15 +45,18 @@ def test_process_forecasts(config_file, sample_forecast_data, sample_wave_data):
     config = load_config(config_file)
     client = ForecastClient(config)
 
-    # Mock API responses
-    with patch("requests.get") as mock_get:
-        mock_responses = [
-            Mock(json=lambda: sample_forecast_data),
-            Mock(json=lambda: sample_forecast_data),  # 15min data
-            Mock(json=lambda: sample_wave_data),
-            Mock(json=lambda: {"arome_france_hd": {"run": "2024-03-14T12:00:00Z"}}),
-        ]
-        mock_get.side_effect = mock_responses
+    # Mock API responses keyed on the URL/params, since the client issues
+    # its requests concurrently and parses raw response content
+    def fake_get(url, params=None, timeout=None):
+        if "marine" in url:
+            data = sample_wave_data
+        elif url.endswith("latest.json"):
+            data = {"reference_time": "2024-03-14T12:00:00Z"}
+        else:
+            data = sample_forecast_data  # hourly and 15-min data
+        return Mock(content=json.dumps(data).encode())
+
+    with patch("requests.Session.get", side_effect=fake_get):
 
         result = client.fetch_forecasts()
 
@@ -75,6 +75,41 @@ def test_calculate_stars():
     assert renderer._calculate_stars(10, test_config) == 0  # below
 
 
+def test_calculate_stars_top_band_always_zero():
+    """The highest-threshold band is dangerous conditions whatever its name."""
+    from windforecast.schemas import WindConfig
+
+    test_config = WindConfig.model_validate(
+        {
+            "spots": [
+                {
+                    "name": "Test Spot",
+                    "lat": 0.0,
+                    "lon": 0.0,
+                    "dir_sector": {"start": 0, "end": 360, "wrap": False},
+                }
+            ],
+            "forecast": {
+                "model": "test",
+                "hourly_vars": "wind_speed_10m",
+                "wave_vars": "wave_height",
+                "forecast_hours_hourly": 48,
+                "forecast_min15": 24,
+            },
+            "time_window": {"day_start": 6, "day_end": 20},
+            "conditions": {
+                "bands": [["insane", 30], ["good", 17], ["light", 12], ["below", 0]],
+                "rain_limit": 0.5,
+            },
+        }
+    )
+
+    renderer = ReportRenderer()
+    assert renderer._calculate_stars(35, test_config) == 0  # top band, despite the name
+    assert renderer._calculate_stars(18, test_config) == 3  # good
+    assert renderer._calculate_stars(13, test_config) == 1  # light
+
+
 def test_stars_html():
     """Test HTML star rating generation."""
     renderer = ReportRenderer()
@@ -7,7 +7,6 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-import pytz
 from bs4 import BeautifulSoup
 
 from windforecast.render import ReportRenderer
@@ -94,7 +93,7 @@ def test_chrome_image_generation(platform, chrome_path, pillow_available, expect
                 assert result == expected
 
 
-def test_model_info_generation():
+def test_model_info_generation(tmp_path):
     """Test model information section generation."""
     renderer = ReportRenderer()
     data = {
@@ -118,28 +117,12 @@ def test_model_info_generation():
         },
     }
 
-    output_path = Path("/tmp/test.html")
-
-    # Create a UTC timezone for testing
-    tz_paris = pytz.timezone("Europe/Paris")
-
-    with patch("pathlib.Path.write_text") as mock_write:
-        with patch(
-            "builtins.open",
-            return_value=MagicMock(
-                __enter__=MagicMock(
-                    return_value=MagicMock(
-                        read=MagicMock(return_value="<!-- FORECAST_DATA --><!-- GENERATED_AT -->")
-                    )
-                )
-            ),
-        ):
-            with patch("pytz.timezone", return_value=tz_paris):
-                renderer.render_html(data, output_path)
-                written_content = mock_write.call_args[0][0]
-                assert "Test Model" in written_content
-                assert "2025-10-19 12:00" in written_content  # UTC time
-                assert "UTC" in written_content
+    output_path = tmp_path / "test.html"
+    renderer.render_html(data, output_path)
+    written_content = output_path.read_text()
+    assert "Test Model" in written_content
+    assert "2025-10-19 12:00" in written_content  # UTC time
+    assert "UTC" in written_content
 
 
 def test_pdf_generation(tmp_path):
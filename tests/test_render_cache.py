@@ -0,0 +1,85 @@
+"""Test the content-addressed render cache."""
+
+import pytest
+
+from windforecast.render import ReportRenderer
+
+
+@pytest.fixture
+def render_data(sample_config_data):
+    """Forecast data in the shape render_html consumes, JSON-serializable."""
+    return {
+        "generated_at": "2024-03-14T12:00:00Z",
+        "model_updates": {"arome_france_hd": {"title": "AROME HD", "run": "2024-03-14T12:00:00Z"}},
+        "config": sample_config_data,
+        "spots": [
+            {
+                "spot": "Test Spot",
+                "rows": [
+                    {
+                        "time": "2024-03-14T12:00:00Z",
+                        "wind_kn": 18.0,
+                        "gust_kn": 22.0,
+                        "dir_deg": 240.0,
+                        "dir": "WSW",
+                        "precip_mm_h": 0.0,
+                        "wave_m": 1.2,
+                        "band": "good",
+                        "kiteable": True,
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def test_render_cache_miss_populates(tmp_path, render_data):
+    """Test that a cache miss renders normally and stores the result."""
+    cache_dir = tmp_path / "cache"
+    renderer = ReportRenderer(cache_dir=cache_dir)
+    output_path = tmp_path / "report.html"
+
+    renderer.render_html(render_data, output_path)
+
+    assert output_path.exists()
+    cached = list(cache_dir.glob("*.html"))
+    assert len(cached) == 1
+    assert cached[0].read_text() == output_path.read_text()
+
+
+def test_render_cache_hit_reuses_file(tmp_path, render_data):
+    """Test that identical data is served from the cache, not re-rendered."""
+    cache_dir = tmp_path / "cache"
+    renderer = ReportRenderer(cache_dir=cache_dir)
+    renderer.render_html(render_data, tmp_path / "first.html")
+
+    # Plant a sentinel in the cached file; a hit must copy it verbatim
+    (cached,) = cache_dir.glob("*.html")
+    cached.write_text("<!-- from cache -->")
+
+    second = tmp_path / "second.html"
+    renderer.render_html(render_data, second)
+    assert second.read_text() == "<!-- from cache -->"
+
+
+def test_render_cache_keys_on_content(tmp_path, render_data):
+    """Test that different data gets its own cache entry."""
+    cache_dir = tmp_path / "cache"
+    renderer = ReportRenderer(cache_dir=cache_dir)
+    renderer.render_html(render_data, tmp_path / "first.html")
+
+    render_data["spots"][0]["rows"][0]["wind_kn"] = 25.0
+    renderer.render_html(render_data, tmp_path / "second.html")
+
+    assert len(list(cache_dir.glob("*.html"))) == 2
+
+
+def test_render_cache_disabled_by_default(tmp_path, render_data):
+    """Test that no cache files appear when cache_dir is not set."""
+    renderer = ReportRenderer()
+    output_path = tmp_path / "report.html"
+
+    renderer.render_html(render_data, output_path)
+
+    assert output_path.exists()
+    assert renderer.cache_dir is None
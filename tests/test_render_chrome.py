@@ -74,6 +74,65 @@ def test_try_chrome_with_sips(output_dir):
         assert "sips" in str(calls[1])  # sips conversion call
 
 
+@pytest.mark.parametrize("quality,expected_subsampling", [(85, 2), (95, 0)])
+def test_try_chrome_jpeg_quality(output_dir, quality, expected_subsampling):
+    """Test that jpeg_quality drives the encode and its chroma subsampling."""
+    renderer = ReportRenderer(jpeg_quality=quality)
+    html_path = output_dir / "test.html"
+    jpg_path = output_dir / "test.jpg"
+    png_path = jpg_path.with_suffix(".png")
+
+    html_path.write_text("<html><body>Test</body></html>")
+
+    mock_image = MagicMock()
+    mock_rgb = MagicMock()
+    mock_image.convert.return_value = mock_rgb
+
+    with patch("subprocess.run") as mock_run, patch(
+        "windforecast.render.Image", MagicMock()
+    ), patch("windforecast.render.Image.open", return_value=mock_image), patch.object(
+        Path, "unlink"
+    ):
+
+        mock_run.return_value.returncode = 0
+        png_path.write_text("")
+
+        success = renderer._try_chrome("/fake/chrome", html_path, jpg_path, (800, 600))
+        assert success
+        save_kwargs = mock_rgb.save.call_args.kwargs
+        assert save_kwargs["quality"] == quality
+        assert save_kwargs["subsampling"] == expected_subsampling
+
+
+def test_try_chrome_device_scale(output_dir):
+    """Test that device_scale adds the scale-factor flag only when set."""
+    html_path = output_dir / "test.html"
+    jpg_path = output_dir / "test.jpg"
+    png_path = jpg_path.with_suffix(".png")
+
+    html_path.write_text("<html><body>Test</body></html>")
+
+    mock_image = MagicMock()
+    mock_image.convert.return_value = MagicMock()
+
+    for device_scale, expected in [(None, False), (2.0, True)]:
+        renderer = ReportRenderer(device_scale=device_scale)
+        with patch("subprocess.run") as mock_run, patch(
+            "windforecast.render.Image", MagicMock()
+        ), patch("windforecast.render.Image.open", return_value=mock_image), patch.object(
+            Path, "unlink"
+        ):
+
+            mock_run.return_value.returncode = 0
+            png_path.write_text("")
+
+            assert renderer._try_chrome("/fake/chrome", html_path, jpg_path, (800, 600))
+            cmd = mock_run.call_args_list[0].args[0]
+            assert ("--force-device-scale-factor=2.0" in cmd) is expected
+            # The flag must come before the trailing file:// URL
+            assert cmd[-1].startswith("file://")
+
+
 def test_try_chrome_no_converter(output_dir):
     """Test Chrome screenshot without any available converter."""
     renderer = ReportRenderer()
@@ -0,0 +1,100 @@
+"""Test the Playwright screenshot path (mocked; playwright is an optional extra)."""
+
+from unittest.mock import MagicMock, patch
+
+from windforecast.render import ReportRenderer
+
+
+def test_try_playwright_screenshot(output_dir):
+    """Test a successful Playwright screenshot straight to JPEG."""
+    renderer = ReportRenderer(jpeg_quality=90)
+    html_path = output_dir / "test.html"
+    jpg_path = output_dir / "test.jpg"
+    html_path.write_text("<html><body>Test</body></html>")
+
+    with patch("windforecast.render.sync_playwright") as mock_sp:
+        browser = mock_sp.return_value.start.return_value.chromium.launch.return_value
+        page = browser.new_page.return_value
+
+        success = renderer._try_playwright(html_path, jpg_path, (800, 600))
+
+        assert success
+        browser.new_page.assert_called_once_with(viewport={"width": 800, "height": 600})
+        page.goto.assert_called_once_with(f"file://{html_path.absolute()}")
+        page.screenshot.assert_called_once_with(
+            path=str(jpg_path.absolute()), type="jpeg", quality=90, full_page=True
+        )
+        page.close.assert_called_once()
+
+
+def test_try_playwright_reuses_browser(output_dir):
+    """Test that the browser is launched once and reused across screenshots."""
+    renderer = ReportRenderer()
+    html_path = output_dir / "test.html"
+    jpg_path = output_dir / "test.jpg"
+    html_path.write_text("<html><body>Test</body></html>")
+
+    with patch("windforecast.render.sync_playwright") as mock_sp:
+        assert renderer._try_playwright(html_path, jpg_path, (800, 600))
+        assert renderer._try_playwright(html_path, jpg_path, (800, 600))
+
+        mock_sp.assert_called_once()
+        browser = mock_sp.return_value.start.return_value.chromium.launch.return_value
+        assert browser.new_page.call_count == 2
+
+
+def test_try_playwright_failure_returns_false(output_dir):
+    """Test that a Playwright launch failure is reported, not raised."""
+    renderer = ReportRenderer()
+    html_path = output_dir / "test.html"
+    jpg_path = output_dir / "test.jpg"
+    html_path.write_text("<html><body>Test</body></html>")
+
+    with patch("windforecast.render.sync_playwright") as mock_sp:
+        mock_sp.return_value.start.side_effect = RuntimeError("no browser")
+
+        success = renderer._try_playwright(html_path, jpg_path, (800, 600))
+        assert not success
+
+
+def test_generate_jpg_falls_back_when_playwright_fails(output_dir):
+    """Test that generate_jpg falls back to Chrome when Playwright fails."""
+    renderer = ReportRenderer()
+    html_path = output_dir / "test.html"
+    jpg_path = output_dir / "test.jpg"
+    html_path.write_text("<html><body>Test</body></html>")
+
+    with patch("windforecast.render.HAS_PLAYWRIGHT", True), patch.object(
+        renderer, "_try_playwright", return_value=False
+    ) as mock_pw, patch.object(
+        renderer, "_find_chrome", return_value="/fake/chrome"
+    ), patch.object(
+        renderer, "_try_chrome", return_value=True
+    ) as mock_chrome:
+
+        success = renderer.generate_jpg(html_path, jpg_path, viewport=(800, 600))
+
+        assert success
+        mock_pw.assert_called_once()
+        mock_chrome.assert_called_once()
+
+
+def test_close_stops_persistent_browser():
+    """Test that close() shuts down the browser and is idempotent."""
+    renderer = ReportRenderer()
+    browser = MagicMock()
+    playwright = MagicMock()
+    renderer._browser = browser
+    renderer._playwright = playwright
+
+    renderer.close()
+
+    browser.close.assert_called_once()
+    playwright.stop.assert_called_once()
+    assert renderer._browser is None
+    assert renderer._playwright is None
+
+    # A second close must not touch the already-stopped instances
+    renderer.close()
+    browser.close.assert_called_once()
+    playwright.stop.assert_called_once()